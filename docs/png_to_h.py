@@ -1,19 +1,28 @@
+import os
 import sys
-import struct
+
+# Bytes emitted per header line; wider lines mean fewer lines to write and parse.
+BYTES_PER_LINE = 32
 
 def png_to_h(png_file, header_file):
     with open(png_file, "rb") as f:
         png_data = f.read()
 
-    # Generate the header content
-    header_content = f"unsigned char {header_file[:-2]}[] = {{\n"
-    for i in range(0, len(png_data), 19):
-        header_content += "    " + ", ".join(f"0x{png_data[j]:02x}" for j in range(i, min(i + 19, len(png_data)))) + ",\n"
-    header_content += "};\n"
-    header_content += f"unsigned int {header_file[:-2]}_len = {len(png_data)};\n"
+    # Hex-convert the whole buffer at once in C (bytes.hex), then slice per byte.
+    hx = png_data.hex()
+    tokens = ["0x" + hx[2 * k:2 * k + 2] for k in range(len(png_data))]
+
+    name = os.path.splitext(header_file)[0]
 
+    # Stream the header straight to disk; no monolithic string in memory.
     with open(header_file, "w") as h:
-        h.write(header_content)
+        h.write(f"unsigned char {name}[] = {{\n")
+        h.writelines(
+            "    " + ", ".join(tokens[i:i + BYTES_PER_LINE]) + ",\n"
+            for i in range(0, len(png_data), BYTES_PER_LINE)
+        )
+        h.write("};\n")
+        h.write(f"unsigned int {name}_len = {len(png_data)};\n")
 
 if __name__ == "__main__":
     if len(sys.argv) != 3:
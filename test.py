@@ -1,6 +1,9 @@
 import argparse
+import os
 import subprocess
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from enum import Enum
 
@@ -21,8 +24,9 @@ class ReturnCode(Enum):
     TEST_ERROR = 1
     ENVIRONMENT_ERROR = 2
 
-def run_command(commands):
-    """Run a command and handle potential errors."""
+def run_command(commands, cwd=None):
+    """Run a command and handle potential errors.
+    Passing `cwd` instead of mutating the process CWD keeps concurrent runs safe."""
     logger.info(f"Running command: {' '.join(commands)}")
     try:
         result = subprocess.run(
@@ -31,6 +35,7 @@ def run_command(commands):
             check=True,
             text=True,
             capture_output=True,
+            cwd=cwd,
         )
         logger.info(f"Command output:\n{result.stdout}\n{result.stderr}")
         return result.returncode
@@ -42,12 +47,14 @@ def run_command(commands):
 def extract_testing_time(log_file):
     """Extract testing time from the last line of the log file.
     Example log line: '[00:000:01.993]  -> 84.683 ms'
-    Returns the value after '->' or 'N/A' if not found."""
+    Returns the value after '->' or 'N/A' if not found.
+    Streams the file keeping only the tail (like `tail -n 1`) instead of
+    loading the whole log into memory."""
     if log_file.exists():
-        content = log_file.read_text()
-        lines = content.splitlines()
-        if lines:  # if there are any lines
-            last_line = lines[-1].strip()
+        with open(log_file) as f:
+            tail = deque(f, maxlen=1)
+        if tail:  # if there are any lines
+            last_line = tail[0].strip()
             if "->" in last_line:
                 try:
                     time_part = last_line.split("->")[1].strip()
@@ -59,12 +66,10 @@ def extract_testing_time(log_file):
 def test_executable(test_dir, executable, args):
     """Test a single executable and return its results."""
     try:
-        executable_path = test_dir / executable
-        # if not executable_path.exists():
-        #     logger.error(f"Executable not found: {executable_path}")
-        #     return (executable, ReturnCode.ENVIRONMENT_ERROR.value, "N/A")
-            
-        return_code = run_command([str(executable_path)] + args)
+        # Absolute path so the child can run with cwd=test_dir, where the scene
+        # arguments and log files resolve.
+        executable_path = (test_dir / executable).resolve()
+        return_code = run_command([str(executable_path)] + args, cwd=test_dir)
         log_file = test_dir / Path(f"log_{executable}.txt")
         testing_time = extract_testing_time(log_file)
         
@@ -85,16 +90,35 @@ def test_all_executables():
         logger.error(f"Test directory '{test_dir}' does not exist.")
         return [], ReturnCode.ENVIRONMENT_ERROR
     
+    # Single scandir pass caches the directory listing; DirEntry.is_file() needs
+    # no extra stat per entry, and the set lookup also covers the Windows ".exe" suffix.
+    available = {entry.name for entry in os.scandir(test_dir) if entry.is_file()}
+
+    # Run independent executables concurrently; the cap stays small because the
+    # tests contend for the same GPU. Futures are collected in submission order
+    # so the report stays deterministic.
+    futures = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for executable, args in EXECUTABLES_WITH_ARGS:
+            logger.info(f"\nTesting: {executable}")
+            if executable not in available and f"{executable}.exe" not in available:
+                logger.error(f"Executable not found: {test_dir / executable}")
+                futures.append((executable, None))
+            else:
+                futures.append((executable, executor.submit(test_executable, test_dir, executable, args)))
+
     results = []
     overall_status = ReturnCode.SUCCESS
-    
-    for executable, args in EXECUTABLES_WITH_ARGS:
-        logger.info(f"\nTesting: {executable}")
-        result = test_executable(test_dir, executable, args)
+
+    for executable, future in futures:
+        if future is None:
+            result = (executable, ReturnCode.ENVIRONMENT_ERROR.value, "N/A")
+        else:
+            result = future.result()
         results.append(result)
         if result[1] != ReturnCode.SUCCESS.value:
             overall_status = ReturnCode.TEST_ERROR
-    
+
     return results, overall_status
 
 def print_report(results):
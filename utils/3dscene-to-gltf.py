@@ -73,8 +73,14 @@ def normalize_blender_path(candidate: str | os.PathLike[str] | None) -> Optional
     return None
 
 
+@lru_cache(maxsize=8)
 def resolve_blender_bin(user_path: str | os.PathLike[str] | None = None) -> Optional[Path]:
-    """Find a usable Blender executable. Searches user override, env, PATH, and Windows defaults."""
+    """Find a usable Blender executable. Searches user override, env, PATH, and Windows defaults.
+
+    Cached per ``user_path``: the GUI re-resolves on startup and before every
+    conversion, and the PATH/``Program Files`` scans are not free on slow
+    filesystems. A Blender installed mid-session needs a restart to be seen.
+    """
     candidates: list[str | os.PathLike[str]] = []
     if user_path:
         candidates.append(user_path)
@@ -97,14 +103,19 @@ def resolve_blender_bin(user_path: str | os.PathLike[str] | None = None) -> Opti
             return resolved
 
     if sys.platform == "win32":
+        # Single dirent-level scan per root; glob() would stat every child while
+        # pattern-matching. DirEntry.is_dir() reuses the cached find data.
         for root in (
-            Path(r"C:\Program Files\Blender Foundation"),
-            Path(r"C:\Program Files (x86)\Blender Foundation"),
+            r"C:\Program Files\Blender Foundation",
+            r"C:\Program Files (x86)\Blender Foundation",
         ):
-            if not root.exists():
+            if not os.path.isdir(root):
                 continue
-            for exe in root.glob(r"Blender*\blender.exe"):
-                return exe
+            for entry in os.scandir(root):
+                if entry.is_dir() and entry.name.startswith("Blender"):
+                    exe = Path(entry.path) / "blender.exe"
+                    if exe.exists():
+                        return exe
 
     return None
 
@@ -233,10 +244,11 @@ def prepare_job(
 # Embedded Blender script
 # --------------------------------------------------------------------------------------
 
-def build_blender_script() -> str:
-    # Stage banners are matched by the GUI to advance a 3-step progress bar;
-    # flush=True is critical so the GUI sees lines without buffering delay.
-    return """\
+# Stage banners are matched by the GUI to advance a 3-step progress bar;
+# flush=True is critical so the GUI sees lines without buffering delay.
+# A constant rather than a builder: the text never varies, so it is assembled
+# once at import instead of per conversion.
+_BLENDER_SCRIPT = """\
 import bpy
 import sys
 import os
@@ -366,7 +378,7 @@ def _blender_script() -> Iterator[Path]:
     os.close(fd)
     path = Path(name)
     try:
-        path.write_text(build_blender_script(), encoding="utf-8")
+        path.write_text(_BLENDER_SCRIPT, encoding="utf-8")
         yield path
     finally:
         try:
@@ -1,9 +1,18 @@
 import json
 import argparse
-import math
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 
-NINETY_DEG_X_ROTATION = [math.sqrt(0.5), 0, 0, math.sqrt(0.5)]
+# Optional C JSON codec; parsing/serializing hundred-MB glTF files is several
+# times faster with it. The stdlib module remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# sqrt(0.5), folded to a literal so the tuple is a compile-time constant.
+NINETY_DEG_X_ROTATION = (0.7071067811865476, 0, 0, 0.7071067811865476)
 
 def reorient_scene(gltf_data):
     if not gltf_data.get('scenes') or not gltf_data['scenes'][0].get('nodes'):
@@ -32,18 +41,23 @@ def reorient_scene(gltf_data):
     return gltf_data
 
 def multiply_quaternions(q1, q2):
-    return [
+    # Tuples are cheaper to build than lists and both JSON writers emit them
+    # as plain arrays.
+    return (
         q1[0]*q2[0] - q1[1]*q2[1] - q1[2]*q2[2] - q1[3]*q2[3],
         q1[0]*q2[1] + q1[1]*q2[0] + q1[2]*q2[3] - q1[3]*q2[2],
         q1[0]*q2[2] - q1[1]*q2[3] + q1[2]*q2[0] + q1[3]*q2[1],
         q1[0]*q2[3] + q1[1]*q2[2] - q1[2]*q2[1] + q1[3]*q2[0]
-    ]
+    )
 
 def modify_gltf(input_file, output_file, metallic_factor, roughness_factor, override, reorient):
     logging.info(f"Reading input file: {input_file}")
     try:
-        with open(input_file, 'r') as f:
-            gltf_data = json.load(f)
+        # One binary read; both parsers take bytes directly, skipping the
+        # TextIOWrapper decoding layer.
+        with open(input_file, 'rb') as f:
+            data = f.read()
+        gltf_data = orjson.loads(data) if orjson is not None else json.loads(data)
     except IOError as e:
         logging.error(f"Error reading input file: {e}")
         return
@@ -54,27 +68,76 @@ def modify_gltf(input_file, output_file, metallic_factor, roughness_factor, over
 
     if 'materials' in gltf_data:
         logging.info("Modifying materials...")
+        # Loop-invariant: clamp once, not per material.
+        metallic = max(0, min(1, metallic_factor))
+        roughness = max(0, min(1, roughness_factor))
         for material in gltf_data['materials']:
-            pbr = material.setdefault('pbrMetallicRoughness', {})
+            # Common case when not overriding: both factors already set, nothing
+            # to do for this material.
+            pbr = material.get('pbrMetallicRoughness')
+            if not override and pbr is not None and 'metallicFactor' in pbr and 'roughnessFactor' in pbr:
+                continue
+            if pbr is None:
+                pbr = material['pbrMetallicRoughness'] = {}
             if 'metallicFactor' not in pbr or override:
-                pbr['metallicFactor'] = max(0, min(1, metallic_factor))
+                pbr['metallicFactor'] = metallic
             if 'roughnessFactor' not in pbr or override:
-                pbr['roughnessFactor'] = max(0, min(1, roughness_factor))
+                pbr['roughnessFactor'] = roughness
     else:
         logging.warning("No materials found in the glTF file.")
 
     logging.info(f"Writing output file: {output_file}")
     try:
-        with open(output_file, 'w') as f:
-            json.dump(gltf_data, f, indent=2)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(gltf_data, option=orjson.OPT_INDENT_2))
+        else:
+            # json.dump streams many small chunks through the file object;
+            # serializing first means a single large write.
+            with open(output_file, 'w') as f:
+                f.write(json.dumps(gltf_data, indent=2))
         logging.info("Modification complete.")
     except IOError as e:
         logging.error(f"Error writing output file: {e}")
 
+def _batch_worker_init(log_level):
+    # Workers are separate processes; configure their logging explicitly
+    # (Windows spawn does not inherit the parent's setup).
+    logging.basicConfig(level=log_level, format='%(levelname)s: %(message)s')
+
+def modify_gltf_batch(input_dir, output_dir, metallic_factor, roughness_factor, override, reorient, log_level):
+    """Modify every .gltf in input_dir, writing same-named files to output_dir.
+
+    JSON parse/serialize is CPU-bound, so the files are fanned out over
+    processes rather than threads."""
+    try:
+        names = sorted(e.name for e in os.scandir(input_dir)
+                       if e.is_file() and e.name.lower().endswith('.gltf'))
+    except OSError as e:
+        logging.error(f"Error reading input directory: {e}")
+        return
+    if not names:
+        logging.warning(f"No .gltf files found in {input_dir}")
+        return
+
+    os.makedirs(output_dir, exist_ok=True)
+    logging.info(f"Modifying {len(names)} files...")
+    with ProcessPoolExecutor(initializer=_batch_worker_init, initargs=(log_level,)) as executor:
+        futures = [
+            executor.submit(modify_gltf,
+                            os.path.join(input_dir, name), os.path.join(output_dir, name),
+                            metallic_factor, roughness_factor, override, reorient)
+            for name in names
+        ]
+        for future in futures:
+            future.result()
+
 def main():
     parser = argparse.ArgumentParser(description="Modify materials in a GLTF file and optionally reorient the scene.")
-    parser.add_argument("input_file", help="Path to the input GLTF file")
-    parser.add_argument("output_file", help="Path to save the modified GLTF file")
+    parser.add_argument("input_file", nargs="?", help="Path to the input GLTF file")
+    parser.add_argument("output_file", nargs="?", help="Path to save the modified GLTF file")
+    parser.add_argument("--input-dir", help="Modify every .gltf in this directory instead of a single file")
+    parser.add_argument("--output-dir", help="Directory for the modified files (with --input-dir)")
     parser.add_argument("--metallic", type=float, default=0.1, help="Set the metallic factor (default: 0.1)")
     parser.add_argument("--roughness", type=float, default=0.1, help="Set the roughness factor (default: 0.1)")
     parser.add_argument("--override", action="store_true", help="Override existing material values if set")
@@ -85,7 +148,17 @@ def main():
 
     logging.basicConfig(level=getattr(logging, args.log), format='%(levelname)s: %(message)s')
 
-    modify_gltf(args.input_file, args.output_file, args.metallic, args.roughness, args.override, args.reorient)
+    if args.input_dir or args.output_dir:
+        if not (args.input_dir and args.output_dir):
+            parser.error("--input-dir and --output-dir must be used together")
+        if args.input_file or args.output_file:
+            parser.error("positional files cannot be combined with --input-dir/--output-dir")
+        modify_gltf_batch(args.input_dir, args.output_dir, args.metallic, args.roughness,
+                          args.override, args.reorient, getattr(logging, args.log))
+    elif args.input_file and args.output_file:
+        modify_gltf(args.input_file, args.output_file, args.metallic, args.roughness, args.override, args.reorient)
+    else:
+        parser.error("provide input_file and output_file, or --input-dir and --output-dir")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file